@@ -19,7 +19,7 @@
     - can store any item of any type, including `None`
       - with one exception, storing `Sentinel('Box')` results in a `Box()`
 - mutable methods can throw `ValueError`
-    - `Box().get()` will throw `ValueError` 
+    - `Box().get()` will throw `ValueError`
 - use functional methods `map` and `bind` to create boxes of other types
 - boxes are iterable
 
@@ -47,12 +47,12 @@ class Box[D]:
       - can store any item of any type, including `None`
         - with one exception, storing `Sentinel('Box')` results in a `Box()`
     - mutable methods can throw `ValueError`
-      - `Box().get()` will throw `ValueError` 
+      - `Box().get()` will throw `ValueError`
     - use functional methods `map` and `bind` to create boxes of other types
 
     """
 
-    __slots__ = ('_item',)
+    __slots__ = ('_item', '_has')
     __match_args__ = ('_item',)
 
     T = TypeVar('T')
@@ -62,28 +62,35 @@ class Box[D]:
     @overload
     def __init__(self, value: D) -> None: ...
 
-    def __init__(self, value: D | Sentinel = Sentinel('Box')) -> None:
-        self._item: D | Sentinel = value
+    def __init__(
+        self, value: D | Sentinel = _sentinel, *, _sentinel: Sentinel = _sentinel
+    ) -> None:
+        self._has = value is not _sentinel
+        self._item = cast(D, value) if self._has else cast(D, None)
 
     def __bool__(self) -> bool:
-        return self._item is not Sentinel('Box')
+        return self._has
 
     def __iter__(self) -> Iterator[D]:
-        if self:
-            yield cast(D, self._item)
+        if self._has:
+            yield self._item
 
     def __repr__(self) -> str:
-        if self:
+        if self._has:
             return 'Box(' + repr(self._item) + ')'
         return 'Box()'
 
     def __len__(self) -> int:
-        return 1 if self else 0
+        return 1 if self._has else 0
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             return False
 
+        if self._has != other._has:
+            return False
+        if not self._has:
+            return True
         if self._item is other._item:
             return True
         if self._item == other._item:
@@ -97,15 +104,17 @@ class Box[D]:
     @overload
     def get(self, alt: Sentinel) -> D | Never: ...
 
-    def get(self, alt: D | Sentinel = Sentinel('Box')) -> D | Never:
+    def get(
+        self, alt: D | Sentinel = _sentinel, *, _sentinel: Sentinel = _sentinel
+    ) -> D | Never:
         """Return the contained value if it exists, otherwise an alternate value.
 
         - alternate value must be of type `~D`
         - raises `ValueError` if an alternate value is not provided but needed
 
         """
-        if self._item is not _sentinel:
-            return cast(D, self._item)
+        if self._has:
+            return self._item
         if alt is _sentinel:
             msg = 'Box: get from empty Box with no alt return value provided'
             raise ValueError(msg)
@@ -117,11 +126,12 @@ class Box[D]:
         - raises `ValueError` if box is empty
 
         """
-        if self._item is _sentinel:
+        if not self._has:
             msg = 'Box: Trying to pop an item from an empty Box'
             raise ValueError(msg)
-        popped = cast(D, self._item)
-        self._item = _sentinel
+        popped = self._item
+        self._item = cast(D, None)
+        self._has = False
         return popped
 
     def push(self, item: D) -> None | Never:
@@ -130,33 +140,34 @@ class Box[D]:
         - raises `ValueError` if box is not empty
 
         """
-        if self._item is Sentinel('Box'):
-            self._item = item
-        else:
+        if self._has:
             msg = 'Box: Trying to push an item in an empty Box'
             raise ValueError(msg)
+        self._item = item
+        self._has = True
         return None
 
     def put(self, item: D) -> None:
         """Put an item in the Box. Discard any previous contents."""
         self._item = item
+        self._has = True
 
     def exchange(self, new_item: D) -> D | Never:
-        if self._item is _sentinel:
+        if not self._has:
             msg = 'Box: Trying to exchange items using an empty Box'
             raise ValueError(msg)
-        popped = cast(D, self._item)
+        popped = self._item
         self._item = new_item
         return popped
 
     def map[T](self, f: Callable[[D], T]) -> Box[T]:
         """Map function `f` over contents. Return new instance."""
-        if self._item is Sentinel('Box'):
-            return Box()
-        return Box(f(cast(D, self._item)))
+        if self._has:
+            return Box(f(self._item))
+        return Box()
 
     def bind[T](self, f: Callable[[D], Box[T]]) -> Box[T]:
         """Flatmap `Box` with function `f`. Return new instance."""
-        if self._item is _sentinel:
-            return Box()
-        return f(cast(D, self._item))
+        if self._has:
+            return f(self._item)
+        return Box()
@@ -21,7 +21,7 @@ Providing a FP interface for tuples. Implemented by inheriting from tuple.
   - inherits from tuple, "is-a" implementation
     - "homogeneous" in its data type
     - supports being further inherited from
-    - unslotted
+    - slotted, instances carry no `__dict__`
   - function `functional_tuple`
     - return an InheritedTuple from function's arguments
 
@@ -30,13 +30,36 @@ Providing a FP interface for tuples. Implemented by inheriting from tuple.
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
-from typing import cast, Never, overload, TypeVar
-from dtools.iterables import FM, accumulate, concat, exhaust, merge
+from functools import lru_cache, reduce
+from itertools import accumulate, chain, zip_longest
+from typing import Any, cast, Final, Never, overload, TypeVar
+from dtools.iterables import FM
 
 __all__ = ['FunctionalTuple']
 
 D = TypeVar('D', covariant=True)
 
+_fill: Final = object()
+
+
+def _bind_concat(subs: tuple[tuple[Any, ...], ...], /) -> Iterator[Any]:
+    return chain.from_iterable(subs)
+
+
+def _bind_merge(subs: tuple[tuple[Any, ...], ...], /) -> Iterator[Any]:
+    return (u for us in zip(*subs) for u in us)
+
+
+def _bind_exhaust(subs: tuple[tuple[Any, ...], ...], /) -> Iterator[Any]:
+    return (u for us in zip_longest(*subs, fillvalue=_fill) for u in us if u is not _fill)
+
+
+_bind_ops: Final[dict[FM, Callable[[tuple[tuple[Any, ...], ...]], Iterator[Any]]]] = {
+    FM.CONCAT: _bind_concat,
+    FM.MERGE: _bind_merge,
+    FM.EXHAUST: _bind_exhaust,
+}
+
 
 class FunctionalTuple[D](tuple[D, ...]):
     """Functional Tuple suitable for inheritance
@@ -48,28 +71,27 @@ class FunctionalTuple[D](tuple[D, ...]):
 
     """
 
+    __slots__ = ()
+
     L = TypeVar('L', covariant=True)
     R = TypeVar('R', covariant=True)
     U = TypeVar('U', covariant=True)
 
     def __reversed__(self) -> Iterator[D]:
-        for ii in range(len(self) - 1, -1, -1):
-            yield (self[ii])
+        return iter(tuple.__getitem__(self, slice(None, None, -1)))
 
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}(' + ', '.join(map(repr, self)) + ')'
 
     def __eq__(self, other: object, /) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-        if (length := len(self)) != len(other):
-            return False
         if self is other:
             return True
-        for ii in range(length):
-            if self[ii] != other[ii]:
-                return False
-        return True
+        if not isinstance(other, self.__class__):
+            return False
+        return tuple.__eq__(self, other)
+
+    # defining __eq__ suppressed the inherited hash, restore it
+    __hash__ = tuple.__hash__
 
     @overload    # type:ignore
     def __getitem__(self, x: int) -> D: ...
@@ -77,13 +99,9 @@ class FunctionalTuple[D](tuple[D, ...]):
     def __getitem__(self, x: slice) -> tuple[D, ...]: ...
 
     def __getitem__(self, idx: int | slice, /) -> tuple[D, ...] | D:
-        def newtup(tup: tuple[D, ...]) -> tuple[D, ...]:
-            return tup[0:-1] + tup[-1:]
-
-        if isinstance(idx, slice):
-            return self.__class__(newtup(super().__getitem__(idx)))
-        else:
-            return super().__getitem__(idx)
+        if type(idx) is slice:
+            return self.__class__(tuple.__getitem__(self, idx))
+        return tuple.__getitem__(self, idx)
 
     def foldl[L](
         self,
@@ -99,19 +117,14 @@ class FunctionalTuple[D](tuple[D, ...]):
         * throws `ValueError` when `FunctionalTuple` empty and a start value not given
 
         """
-        it = iter(self)
         if start is not None:
-            acc = start
-        elif self:
-            acc = cast(L, next(it))
-        else:
-            if default is None:
-                msg = 'Both start and default cannot be None for an empty FunctionalTuple'
-                raise ValueError('FunctionalTuple.foldl - ' + msg)
-            acc = default
-        for v in it:
-            acc = f(acc, v)
-        return acc
+            return reduce(f, self, start)
+        if self:
+            return cast(L, reduce(f, self))  # L = D in this case
+        if default is None:
+            msg = 'Both start and default cannot be None for an empty FunctionalTuple'
+            raise ValueError('FunctionalTuple.foldl - ' + msg)
+        return default
 
     def foldr[R](
         self,
@@ -127,29 +140,29 @@ class FunctionalTuple[D](tuple[D, ...]):
         * throws `ValueError` when `FunctionalTuple` empty and a start value not given
 
         """
-        it = reversed(self)
+        rev = tuple.__getitem__(self, slice(None, None, -1))
         if start is not None:
-            acc = start
-        elif self:
-            acc = cast(R, next(it))
-        else:
-            if default is None:
-                msg = 'Both start and default cannot be None for an empty FunctionalTuple'
-                raise ValueError('FunctionalTuple.foldR - ' + msg)
-            acc = default
-        for v in it:
-            acc = f(v, acc)
-        return acc
+            return reduce(lambda acc, d: f(d, acc), rev, start)
+        if self:
+            return cast(R, reduce(lambda acc, d: f(d, acc), rev))
+        if default is None:
+            msg = 'Both start and default cannot be None for an empty FunctionalTuple'
+            raise ValueError('FunctionalTuple.foldR - ' + msg)
+        return default
 
     def copy(self) -> FunctionalTuple[D]:
-        """Return a shallow copy of FunctionalTuple in O(1) time & space complexity."""
-        return self.__class__(self)
+        """Return a shallow copy of FunctionalTuple in O(1) time & space complexity.
+
+        - since a FunctionalTuple is immutable, just returns itself
+
+        """
+        return self
 
     def __add__(self, other: object, /) -> tuple[D, ...]:
         if not isinstance(other, FunctionalTuple):
             msg = 'FunctionalTuple being added to something not an FunctionalTuple'
             raise ValueError(msg)
-        return self.__class__(concat(self, other))
+        return self.__class__(tuple.__add__(self, other))
 
     def __mul__(self, num: int, /) -> tuple[D, ...]:
         return self.__class__(super().__mul__(num))
@@ -168,13 +181,17 @@ class FunctionalTuple[D](tuple[D, ...]):
         """
         if s is None:
             return FunctionalTuple(accumulate(self, f))
-        return FunctionalTuple(accumulate(self, f, s))
+        return FunctionalTuple(accumulate(self, f, initial=s))
 
     def map[U](self, f: Callable[[D], U], /) -> FunctionalTuple[U]:
         return FunctionalTuple(map(f, self))
 
     def bind[U](
-        self, f: Callable[[D], FunctionalTuple[U]], type: FM = FM.CONCAT, /
+        self,
+        f: Callable[[D], FunctionalTuple[U]],
+        type: FM = FM.CONCAT,
+        /,
+        memoize: bool = False,
     ) -> FunctionalTuple[U] | Never:
         """Bind function `f` to the `FunctionalTuple`.
 
@@ -182,18 +199,39 @@ class FunctionalTuple[D](tuple[D, ...]):
           * CONCAT: sequentially concatenate iterables one after the other
           * MERGE: round-robin merge iterables until one is exhausted
           * EXHAUST: round-robin merge iterables until all are exhausted
+        * when `memoize` true, `f` is called once per distinct hashable element
 
         """
-        match type:
-            case FM.CONCAT:
-                return FunctionalTuple(concat(*map(f, self)))
-            case FM.MERGE:
-                return FunctionalTuple(merge(*map(f, self)))
-            case FM.EXHAUST:
-                return FunctionalTuple(exhaust(*map(f, self)))
-
-        raise ValueError('Unknown FM type')
+        op = _bind_ops.get(type)
+        if op is None:
+            raise ValueError('Unknown FM type')
+        if memoize:
+            f = lru_cache(maxsize=None)(f)
+        return FunctionalTuple(op(tuple(map(f, self))))
+
+    def bind_concat[U](self, f: Callable[[D], FunctionalTuple[U]], /) -> FunctionalTuple[U]:
+        """Bind function `f`, sequentially concatenating the results."""
+        return FunctionalTuple(_bind_concat(tuple(map(f, self))))
+
+    def bind_merge[U](self, f: Callable[[D], FunctionalTuple[U]], /) -> FunctionalTuple[U]:
+        """Bind function `f`, merging results until one is exhausted."""
+        return FunctionalTuple(_bind_merge(tuple(map(f, self))))
+
+    def bind_exhaust[U](self, f: Callable[[D], FunctionalTuple[U]], /) -> FunctionalTuple[U]:
+        """Bind function `f`, merging results until all are exhausted."""
+        return FunctionalTuple(_bind_exhaust(tuple(map(f, self))))
+
+
+@lru_cache(maxsize=1024)
+def _functional_tuple_cached[D](
+    ds: tuple[D, ...], _types: tuple[type, ...]
+) -> FunctionalTuple[D]:
+    return FunctionalTuple(ds)
 
 
-def functional_tuple[D](*ds: D):
-    return FunctionalTuple(ds)
+def functional_tuple[D](*ds: D) -> FunctionalTuple[D]:
+    # cache keyed on element types too, lest 1 and 1.0 share an instance
+    try:
+        return _functional_tuple_cached(ds, tuple(map(type, ds)))
+    except TypeError:  # unhashable arguments cannot be cached
+        return FunctionalTuple(ds)
@@ -17,7 +17,7 @@
 
 - immutable data structure whose elements are all of the same type
 - hashable if elements are hashable
-  - TODO: not sure if I am enforcing hashability
+  - hashability enforced at runtime when first hashed, hash then cached
 - declared covariant in its generic datatype
   - hashability should be enforced by LSP tooling
   - hashability will be enforced at runtime
@@ -29,13 +29,21 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator, Hashable
-from typing import cast, Never, overload, TypeVar
-from dtools.iterables import FM, accumulate, concat, exhaust, merge
+from functools import lru_cache, reduce
+from itertools import accumulate, chain
+from typing import Any, cast, Final, Never, overload, TypeVar
+from dtools.iterables import FM, exhaust, merge
 
 __all__ = ['ImmutableList', 'immutable_list']
 
 D_co = TypeVar('D_co', covariant=True)
 
+_bind_ops: Final[dict[FM, Callable[..., Iterator[Any]]]] = {
+    FM.CONCAT: chain.from_iterable,
+    FM.MERGE: lambda ils: merge(*ils),
+    FM.EXHAUST: lambda ils: exhaust(*ils),
+}
+
 
 class ImmutableList[D_co](Hashable):
     """Immutable List like data structures
@@ -51,35 +59,57 @@ class ImmutableList[D_co](Hashable):
 
     """
 
-    __slots__ = ('_ds', '_len', '_hash')
-    __match_args__ = ('_ds', '_len')
+    __slots__ = ('_ds', '_hash')
+    __match_args__ = ('_ds',)
 
     L_co = TypeVar('L_co', covariant=True)
     R_co = TypeVar('R_co', covariant=True)
     U_co = TypeVar('U_co', covariant=True)
 
-    def __init__(self, *dss: Iterable[D_co]) -> None:
-        if (size := len(dss)) > 1:
-            msg = f'ImmutableList expects at most 1 iterable argument, got {size}'
-            raise ValueError(msg)
+    def __init__(self, ds: Iterable[D_co] = (), /) -> None:
+        if type(ds) is tuple:
+            self._ds: tuple[D_co, ...] = ds
+        elif isinstance(ds, ImmutableList):
+            self._ds = ds._ds
         else:
-            self._ds: tuple[D_co, ...] = tuple(dss[0]) if size == 1 else tuple()
-            self._len = len(self._ds)
+            self._ds = tuple(ds)
+        self._hash = -1
+
+    @classmethod
+    def _from_tuple(cls, ds: tuple[D_co, ...], /) -> ImmutableList[D_co]:
+        """Adopt an existing tuple as the backing storage of a new instance.
+
+        - private fast path bypassing the `__init__` argument handling
+        - caller must hand over a tuple it will not mutate
+        - empty results share one module-level instance
+
+        """
+        if not ds and cls is ImmutableList:
+            return cast(ImmutableList[D_co], _empty)
+        il = cls.__new__(cls)
+        il._ds = ds
+        il._hash = -1
+        return il
+
+    def __hash__(self) -> int:
+        # lazily computed then cached, hash() never returns -1
+        if self._hash == -1:
             try:
-                self._hash = hash((self._len, 42) + self._ds)
+                self._hash = hash((len(self._ds), 42) + self._ds)
             except TypeError as exc:
                 msg = f'ImmutableList: {exc}'
                 raise TypeError(msg)
-
-    def __hash__(self) -> int:
         return self._hash
 
     def __iter__(self) -> Iterator[D_co]:
-        return iter(self._ds)
+        return self._ds.__iter__()
 
     def __reversed__(self) -> Iterator[D_co]:
         return reversed(self._ds)
 
+    def __contains__(self, d: object, /) -> bool:
+        return d in self._ds
+
     def __bool__(self) -> bool:
         return bool(self._ds)
 
@@ -87,16 +117,14 @@ class ImmutableList[D_co](Hashable):
         return len(self._ds)
 
     def __repr__(self) -> str:
-        return 'immutable_list(' + ', '.join(map(repr, self)) + ')'
+        return 'immutable_list(' + ', '.join(map(repr, self._ds)) + ')'
 
     def __str__(self) -> str:
-        return '((' + ', '.join(map(repr, self)) + '))'
+        return '((' + ', '.join(map(repr, self._ds)) + '))'
 
     def __eq__(self, other: object, /) -> bool:
         if not isinstance(other, ImmutableList):
             return NotImplemented  # magic object
-        if self._len != other._len:
-            return False
         if self._ds is other._ds:
             return True
         return self._ds == other._ds
@@ -107,8 +135,8 @@ class ImmutableList[D_co](Hashable):
     def __getitem__(self, idx: slice, /) -> ImmutableList[D_co]: ...
 
     def __getitem__(self, idx: slice | int, /) -> ImmutableList[D_co] | D_co:
-        if isinstance(idx, slice):
-            return ImmutableList(self._ds[idx])
+        if type(idx) is slice:
+            return ImmutableList._from_tuple(self._ds[idx])
         return self._ds[idx]
 
     def foldl[L_co](
@@ -125,21 +153,17 @@ class ImmutableList[D_co](Hashable):
         - throws `ValueError` when `ImmutableList` empty and a start value not given
 
         """
-        it = iter(self._ds)
+        ds = self._ds
         if start is not None:
-            acc = start
-        elif self:
-            acc = cast(L_co, next(it))  # L_co = D_co in this case
-        else:
-            if default is None:
-                msg0 = 'ImmutableList: foldl method requires '
-                msg1 = 'either start or default to be defined for '
-                msg2 = 'an empty ImmutableList'
-                raise ValueError(msg0 + msg1 + msg2)
-            acc = default
-        for v in it:
-            acc = f(acc, v)
-        return acc
+            return reduce(f, ds, start)
+        if ds:
+            return cast(L_co, reduce(f, ds))  # L_co = D_co in this case
+        if default is None:
+            msg0 = 'ImmutableList: foldl method requires '
+            msg1 = 'either start or default to be defined for '
+            msg2 = 'an empty ImmutableList'
+            raise ValueError(msg0 + msg1 + msg2)
+        return default
 
     def foldr[R_co](
         self,
@@ -155,34 +179,38 @@ class ImmutableList[D_co](Hashable):
         - throws `ValueError` when `ImmutableList` empty and a start value not given
 
         """
-        it = reversed(self._ds)
+        ds = self._ds[::-1]
         if start is not None:
-            acc = start
-        elif self:
-            acc = cast(R_co, next(it))
-        else:
-            if default is None:
-                msg0 = 'ImmutableList: foldr method requires '
-                msg1 = 'either start or default to be defined for '
-                msg2 = 'an empty ImmutableList'
-                raise ValueError(msg0 + msg1 + msg2)
-            acc = default
-        for v in it:
-            acc = f(v, acc)
-        return acc
+            return reduce(lambda acc, d: f(d, acc), ds, start)
+        if ds:
+            return cast(R_co, reduce(lambda acc, d: f(d, acc), ds))
+        if default is None:
+            msg0 = 'ImmutableList: foldr method requires '
+            msg1 = 'either start or default to be defined for '
+            msg2 = 'an empty ImmutableList'
+            raise ValueError(msg0 + msg1 + msg2)
+        return default
+
+    def copy(self) -> ImmutableList[D_co]:
+        """Return a shallow copy of ImmutableList in O(1) time & space complexity.
+
+        - since an ImmutableList is immutable, just returns itself
+
+        """
+        return self
 
     def __add__(self, other: ImmutableList[D_co], /) -> ImmutableList[D_co]:
         if not isinstance(other, ImmutableList):
             msg = 'ImmutableList being added to something not a ImmutableList'
             raise ValueError(msg)
 
-        return ImmutableList(concat(self, other))
+        return ImmutableList._from_tuple(self._ds + other._ds)
 
     def __mul__(self, num: int, /) -> ImmutableList[D_co]:
-        return ImmutableList(self._ds.__mul__(num if num > 0 else 0))
+        return ImmutableList._from_tuple(self._ds * (num if num > 0 else 0))
 
     def __rmul__(self, num: int, /) -> ImmutableList[D_co]:
-        return ImmutableList(self._ds.__mul__(num if num > 0 else 0))
+        return ImmutableList._from_tuple(self._ds * (num if num > 0 else 0))
 
     def accummulate[L_co](
         self, f: Callable[[L_co, D_co], L_co], s: L_co | None = None, /
@@ -194,11 +222,11 @@ class ImmutableList[D_co](Hashable):
 
         """
         if s is None:
-            return ImmutableList(accumulate(self, f))
-        return ImmutableList(accumulate(self, f, s))
+            return ImmutableList._from_tuple(tuple(accumulate(self._ds, f)))
+        return ImmutableList._from_tuple(tuple(accumulate(self._ds, f, initial=s)))
 
     def map[U_co](self, f: Callable[[D_co], U_co], /) -> ImmutableList[U_co]:
-        return ImmutableList(map(f, self))
+        return ImmutableList._from_tuple(tuple(map(f, self._ds)))
 
     def bind[U_co](
         self, f: Callable[[D_co], ImmutableList[U_co]], type: FM = FM.CONCAT, /
@@ -211,16 +239,26 @@ class ImmutableList[D_co](Hashable):
           * EXHAUST: round-robin merge iterables until all are exhausted
 
         """
-        match type:
-            case FM.CONCAT:
-                return ImmutableList(concat(*map(f, self)))
-            case FM.MERGE:
-                return ImmutableList(merge(*map(f, self)))
-            case FM.EXHAUST:
-                return ImmutableList(exhaust(*map(f, self)))
+        op = _bind_ops.get(type)
+        if op is None:
+            raise ValueError(f'ImmutableList: Unknown FM type: {type}')
+        subs = [il_u._ds for il_u in map(f, self._ds)]
+        return ImmutableList._from_tuple(tuple(op(subs)))
 
-        raise ValueError(f'ImmutableList: Unknown FM type: {type}')
 
+_empty: Final[ImmutableList[Any]] = ImmutableList()
 
-def immutable_list[D_co](*ds: D_co) -> ImmutableList[D_co]:
+
+@lru_cache(maxsize=1024)
+def _immutable_list_cached[D_co](
+    ds: tuple[D_co, ...], _types: tuple[type, ...]
+) -> ImmutableList[D_co]:
     return ImmutableList(ds)
+
+
+def immutable_list[D_co](*ds: D_co) -> ImmutableList[D_co]:
+    # cache keyed on element types too, lest 1 and 1.0 share an instance
+    try:
+        return _immutable_list_cached(ds, tuple(map(type, ds)))
+    except TypeError:  # unhashable arguments cannot be cached
+        return ImmutableList._from_tuple(ds)
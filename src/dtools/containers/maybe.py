@@ -25,7 +25,7 @@ from __future__ import annotations
 __all__ = ['MayBe']
 
 from collections.abc import Callable, Iterator, Sequence
-from typing import cast, Final, Never, overload, TypeVar
+from typing import Any, cast, Final, Never, overload, TypeVar
 from dtools.fp.singletons import Sentinel
 
 D = TypeVar('D', covariant=True)
@@ -207,19 +207,11 @@ class MayBe[D]:
     @staticmethod
     def failable_index[V](vs: Sequence[V], ii: int) -> MayBe[V]:
         """Return a MayBe of an indexed value that can fail"""
-        try:
-            mb_return = MayBe(vs[ii])
-        except (
-            LookupError,
-            ValueError,
-            TypeError,
-            BufferError,
-            ArithmeticError,
-            RecursionError,
-            ReferenceError,
-            RuntimeError,
-        ):
-            mb_return = MayBe()
+        n = len(vs)
+        if -n <= ii < n:
+            return MayBe(vs[ii])
+        return _nothing
 
-        return mb_return
+
+_nothing: Final[MayBe[Any]] = MayBe()
 
@@ -277,14 +277,7 @@ class Xor[L, R]:
     @staticmethod
     def failable_index[V](v: Sequence[V], ii: int) -> Xor[V, Exception]:
         """Return an Xor of an indexed value that can fail"""
-        try:
-            xor_return = Xor[V, Exception](v[ii], LEFT)
-        except (
-            IndexError,
-            TypeError,
-            ArithmeticError,
-            RuntimeError,
-        ) as exc:
-            xor_return = Xor(exc, RIGHT)
-
-        return xor_return
+        n = len(v)
+        if -n <= ii < n:
+            return Xor[V, Exception](v[ii], LEFT)
+        return Xor(IndexError('tuple index out of range'), RIGHT)
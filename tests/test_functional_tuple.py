@@ -50,7 +50,7 @@ class TestFunctionalTuple:
         assert isinstance(ft3, FT)
         ft4 = ft3.copy()
         assert ft4 == ft3
-        assert ft4 is not ft3
+        assert ft4 is ft3
         mb_int42 = MB.failable_index(ft1, 0)
         reveal_type(NotImplemented)
         reveal_type(mb_int42)
@@ -60,6 +60,13 @@ class TestFunctionalTuple:
         assert str(Xor.failable_index(ft2, 42)) == str(Xor(IndexError('tuple index out of range'), RIGHT))
         assert str(Xor.failable_index(ft2, 42).get_right().get()) == 'tuple index out of range'
 
+    def test_hashable(self) -> None:
+        ft1 = ft(1, 2, 3)
+        assert hash(ft1) == hash((1, 2, 3))
+        assert len({ft1, ft(1, 2, 3), FT((1, 2, 3))}) == 1
+        d = {ft1: 42}
+        assert d[FT((1, 2, 3))] == 42
+
     def test_indexing(self) -> None:
         ft0: FT[str] = FT()
         ft1 = ft("Emily", "Rachel", "Sarah", "Rebekah", "Mary")
@@ -172,6 +179,35 @@ class TestFunctionalTuple:
         assert mm == FT()
         assert em == FT()
 
+    def test_bind_memoize(self) -> None:
+        calls: list[int] = []
+
+        def ff(n: int) -> FT[int]:
+            calls.append(n)
+            return FT(range(n))
+
+        ft1 = ft(2, 2, 3, 2)
+        fm = ft1.bind(ff, FM.CONCAT, memoize=True)
+        assert fm == ft(0, 1, 0, 1, 0, 1, 2, 0, 1)
+        assert calls == [2, 3]
+        assert fm == ft1.bind(ff, FM.CONCAT)
+        assert calls == [2, 3, 2, 2, 3, 2]
+
+    def test_bind_variants(self) -> None:
+        ft0: FT[int] = ft()
+        ft1 = ft(4, 2, 3, 5)
+
+        def ff(n: int) -> FT[int]:
+            return FT(range(n))
+
+        assert ft1.bind_concat(ff) == ft(0, 1, 2, 3, 0, 1, 0, 1, 2, 0, 1, 2, 3, 4)
+        assert ft1.bind_merge(ff) == ft(0, 0, 0, 0, 1, 1, 1, 1)
+        assert ft1.bind_exhaust(ff) == ft(0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 3, 3, 4)
+
+        assert ft0.bind_concat(ff) == FT()
+        assert ft0.bind_merge(ff) == FT()
+        assert ft0.bind_exhaust(ff) == FT()
+
     def test_add(self) -> None:
         foo = ft(1, 2, 3)
         bar = ft(4, 5)
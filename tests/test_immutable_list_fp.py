@@ -15,6 +15,7 @@
 """Test FP use cases"""
 
 from __future__ import annotations
+from operator import add, mul
 from dtools.containers.immutable_list import ImmutableList as IL
 from dtools.containers.immutable_list import immutable_list as il
 from dtools.containers.maybe import MayBe as MB
@@ -26,12 +27,6 @@ class TestFP:
     """FP test of ImmutableList with other datastructures"""
     def test_fold(self) -> None:
         """Test folding"""
-        def add2(x: int, y: int) -> int:
-            return x + y
-
-        def mult2[S](x: int, y: int) -> int:
-            return x * y
-
         def push_se[S](se: SE[S], d: S) -> SE[S]:
             se.push(d)
             return se
@@ -44,36 +39,36 @@ class TestFP:
         assert il5[1] == 2
         assert il5[4] == 5
 
-        assert il0.foldl(add2, 42) == 42
-        assert il0.foldr(add2, 42) == 42
-        assert il5.foldl(add2) == 15
-        assert il5.foldl(add2, 0) == 15
-        assert il5.foldl(add2, 10) == 25
-        assert il5.foldl(mult2, 1) == 120
-        assert il5.foldl(mult2, 10) == 1200
-        assert il5.foldr(add2) == 15
-        assert il5.foldr(add2, 0) == 15
-        assert il5.foldr(add2, 10) == 25
-        assert il5.foldr(mult2, 1) == 120
-        assert il5.foldr(mult2, 10) == 1200
+        assert il0.foldl(add, 42) == 42
+        assert il0.foldr(add, 42) == 42
+        assert il5.foldl(add) == 15
+        assert il5.foldl(add, 0) == 15
+        assert il5.foldl(add, 10) == 25
+        assert il5.foldl(mul, 1) == 120
+        assert il5.foldl(mul, 10) == 1200
+        assert il5.foldr(add) == 15
+        assert il5.foldr(add, 0) == 15
+        assert il5.foldr(add, 10) == 25
+        assert il5.foldr(mul, 1) == 120
+        assert il5.foldr(mul, 10) == 1200
         assert il5 == il(1, 2, 3, 4, 5)
 
-        assert se5.fold(add2) == 15
-        assert se5.fold(add2, 10) == 25
-        assert se5.fold(mult2) == 120
-        assert se5.fold(mult2, 10) == 1200
+        assert se5.fold(add) == 15
+        assert se5.fold(add, 10) == 25
+        assert se5.fold(mul) == 120
+        assert se5.fold(mul, 10) == 1200
         se_temp = se5.copy()
         se_temp.pop()
         se5_rev = se_temp.fold(push_se, SE(se5.peak()))
         assert se5_rev == SE(5, 4, 3, 2, 1)
-        assert se5.fold(add2) == 15
-        assert se5.fold(add2, 10) == 25
+        assert se5.fold(add) == 15
+        assert se5.fold(add, 10) == 25
 
-        assert il5.accummulate(add2) == il(1, 3, 6, 10, 15)
-        assert il5.accummulate(add2, 10) == il(10, 11, 13, 16, 20, 25)
-        assert il5.accummulate(mult2) == il(1, 2, 6, 24, 120)
-        assert il0.accummulate(add2) == il()
-        assert il0.accummulate(mult2) == il()
+        assert il5.accummulate(add) == il(1, 3, 6, 10, 15)
+        assert il5.accummulate(add, 10) == il(10, 11, 13, 16, 20, 25)
+        assert il5.accummulate(mul) == il(1, 2, 6, 24, 120)
+        assert il0.accummulate(add) == il()
+        assert il0.accummulate(mul) == il()
 
     def test_immutablelist_bind(self) -> None:
         """Test bind (flatmap)"""